@@ -0,0 +1,143 @@
+package com.tsystems.gitb;
+
+import javax.net.ssl.KeyManager;
+import java.io.IOException;
+import java.nio.ByteBuffer;
+import java.nio.charset.StandardCharsets;
+import java.security.GeneralSecurityException;
+import java.security.MessageDigest;
+import java.security.NoSuchAlgorithmException;
+import java.time.Duration;
+import java.util.HexFormat;
+import java.util.LinkedHashMap;
+import java.util.Map;
+import java.util.function.LongSupplier;
+
+/**
+ * Size-limited cache of the key managers built for mTLS credentials, with entries expiring after a fixed time.
+ * <p/>
+ * Entries are keyed by a SHA-256 digest of the credentials so that the PEM inputs themselves are not retained. When
+ * full, the least recently used entry is evicted.
+ */
+class KeyManagerCache {
+
+    /** The maximum number of entries kept. */
+    private final int maxEntries;
+    /** The time (in milliseconds) after which an entry expires. */
+    private final long ttlMillis;
+    /** The clock (in milliseconds) used to expire entries. */
+    private final LongSupplier clock;
+    /** The cached entries in access order. */
+    private final Map<String, CachedKeyManagers> entries;
+    /** Lock object to use for synchronisation. */
+    private final Object lock = new Object();
+
+    /**
+     * Constructor.
+     *
+     * @param maxEntries The maximum number of entries to keep.
+     * @param ttl The time after which an entry expires.
+     */
+    KeyManagerCache(int maxEntries, Duration ttl) {
+        this(maxEntries, ttl, System::currentTimeMillis);
+    }
+
+    /**
+     * Constructor.
+     *
+     * @param maxEntries The maximum number of entries to keep.
+     * @param ttl The time after which an entry expires.
+     * @param clock The clock (in milliseconds) to use.
+     */
+    KeyManagerCache(int maxEntries, Duration ttl, LongSupplier clock) {
+        this.maxEntries = maxEntries;
+        this.ttlMillis = ttl.toMillis();
+        this.clock = clock;
+        this.entries = new LinkedHashMap<>(16, 0.75f, true) {
+            @Override
+            protected boolean removeEldestEntry(Map.Entry<String, CachedKeyManagers> eldest) {
+                return size() > KeyManagerCache.this.maxEntries;
+            }
+        };
+    }
+
+    /**
+     * Get the key managers for the provided credentials, using the loader if they are not cached or have expired.
+     * <p/>
+     * The loader is called outside the lock, so concurrent misses for the same credentials may each load them.
+     *
+     * @param privateKey The PEM encoded PKCS#8 private key.
+     * @param publicKey The PEM encoded certificate chain.
+     * @param privateKeyType The private key's algorithm.
+     * @param loader The loader to build the key managers with.
+     * @return The key managers.
+     */
+    KeyManager[] get(String privateKey, String publicKey, String privateKeyType, KeyManagerLoader loader)
+            throws IOException, GeneralSecurityException {
+        String key = digest(privateKey, publicKey, privateKeyType);
+        synchronized (lock) {
+            CachedKeyManagers cached = entries.get(key);
+            if (cached != null && cached.expiresAt() > clock.getAsLong()) {
+                return cached.keyManagers();
+            }
+        }
+        KeyManager[] keyManagers = loader.load();
+        synchronized (lock) {
+            long now = clock.getAsLong();
+            entries.values().removeIf(cached -> cached.expiresAt() <= now);
+            entries.put(key, new CachedKeyManagers(keyManagers, now + ttlMillis));
+        }
+        return keyManagers;
+    }
+
+    /**
+     * Get the number of entries currently held (including expired entries not yet removed).
+     *
+     * @return The number of entries.
+     */
+    int size() {
+        synchronized (lock) {
+            return entries.size();
+        }
+    }
+
+    /**
+     * Compute the cache key for the provided values (length-prefixed so that values cannot run into each other).
+     *
+     * @param values The values to digest.
+     * @return The hex encoded SHA-256 digest.
+     */
+    private static String digest(String... values) throws NoSuchAlgorithmException {
+        MessageDigest digest = MessageDigest.getInstance("SHA-256");
+        for (String value : values) {
+            byte[] bytes = value.getBytes(StandardCharsets.UTF_8);
+            digest.update(ByteBuffer.allocate(Integer.BYTES).putInt(bytes.length).array());
+            digest.update(bytes);
+        }
+        return HexFormat.of().formatHex(digest.digest());
+    }
+
+    /**
+     * Function used to build the key managers on a cache miss.
+     */
+    @FunctionalInterface
+    interface KeyManagerLoader {
+
+        /**
+         * Build the key managers.
+         *
+         * @return The key managers.
+         */
+        KeyManager[] load() throws IOException, GeneralSecurityException;
+
+    }
+
+    /**
+     * A cached entry.
+     *
+     * @param keyManagers The key managers.
+     * @param expiresAt The time (in milliseconds) at which the entry expires.
+     */
+    private record CachedKeyManagers(KeyManager[] keyManagers, long expiresAt) {}
+
+}
@@ -30,6 +30,18 @@ public class Utils {
     public static final QName REPLY_TO_QNAME = new QName("http://www.w3.org/2005/08/addressing", "ReplyTo");
     /** SOAP header name for the test session ID. */
     public static final QName TEST_SESSION_ID_QNAME = new QName("http://www.gitb.com", "TestSessionIdentifier", "gitb");
+    /** Client used to look up URI inputs, shared so that connections are pooled and kept alive across lookups. */
+    private static final HttpClient HTTP_CLIENT = HttpClient.newHttpClient();
+    /** Factory used to timestamp reports (looked up once as the JAXP lookup is costly). */
+    private static final DatatypeFactory DATATYPE_FACTORY;
+
+    static {
+        try {
+            DATATYPE_FACTORY = DatatypeFactory.newInstance();
+        } catch (DatatypeConfigurationException e) {
+            throw new IllegalStateException(e);
+        }
+    }
 
     @Autowired
     private ObjectFactory objectFactory;
@@ -47,11 +59,7 @@ public class Utils {
         report.setContext(new AnyContent());
         report.getContext().setType("map");
         report.setResult(result);
-        try {
-            report.setDate(DatatypeFactory.newInstance().newXMLGregorianCalendar(new GregorianCalendar()));
-        } catch (DatatypeConfigurationException e) {
-            throw new IllegalStateException(e);
-        }
+        report.setDate(DATATYPE_FACTORY.newXMLGregorianCalendar(new GregorianCalendar()));
         return report;
     }
 
@@ -102,13 +110,11 @@ public class Utils {
      * @return The input.
      */
     public AnyContent getSingleRequiredInputForName(List<AnyContent> parameterItems, String inputName) {
-        var inputs = getInputsForName(parameterItems, inputName);
-        if (inputs.isEmpty()) {
+        var input = findSingleInputForName(parameterItems, inputName, "Multiple inputs named [%s] were found when only one was expected.");
+        if (input == null) {
             throw new IllegalArgumentException(String.format("No input named [%s] was found.", inputName));
-        } else if (inputs.size() > 1) {
-            throw new IllegalArgumentException(String.format("Multiple inputs named [%s] were found when only one was expected.", inputName));
         }
-        return inputs.get(0);
+        return input;
     }
 
     /**
@@ -119,14 +125,30 @@ public class Utils {
      * @return The input.
      */
     public Optional<AnyContent> getSingleOptionalInputForName(List<AnyContent> parameterItems, String inputName) {
-        var inputs = getInputsForName(parameterItems, inputName);
-        if (inputs.isEmpty()) {
-            return Optional.empty();
-        } else if (inputs.size() > 1) {
-            throw new IllegalArgumentException(String.format("Multiple inputs named [%s] were found when at most one was expected.", inputName));
-        } else {
-            return Optional.of(inputs.get(0));
+        return Optional.ofNullable(findSingleInputForName(parameterItems, inputName, "Multiple inputs named [%s] were found when at most one was expected."));
+    }
+
+    /**
+     * Find the input matching the provided name in a single pass, failing as soon as a second match is found.
+     *
+     * @param parameterItems The items to look through.
+     * @param inputName The name of the input to look for.
+     * @param multipleInputsMessage The message (with a placeholder for the input's name) to report multiple matches with.
+     * @return The input (null if not found).
+     */
+    private AnyContent findSingleInputForName(List<AnyContent> parameterItems, String inputName, String multipleInputsMessage) {
+        AnyContent match = null;
+        if (parameterItems != null) {
+            for (AnyContent anInput: parameterItems) {
+                if (inputName.equals(anInput.getName())) {
+                    if (match != null) {
+                        throw new IllegalArgumentException(String.format(multipleInputsMessage, inputName));
+                    }
+                    match = anInput;
+                }
+            }
         }
+        return match;
     }
 
     /**
@@ -148,7 +170,7 @@ public class Utils {
                         .uri(new URI(content.getValue()))
                         .GET()
                         .build();
-                return HttpClient.newHttpClient()
+                return HTTP_CLIENT
                         .send(request, HttpResponse.BodyHandlers.ofString())
                         .body();
             } catch (URISyntaxException e) {
@@ -192,7 +214,7 @@ public class Utils {
                         .uri(new URI(input.getValue()))
                         .GET()
                         .build();
-                return HttpClient.newHttpClient()
+                return HTTP_CLIENT
                         .send(request, HttpResponse.BodyHandlers.ofByteArray())
                         .body();
             } catch (URISyntaxException e) {
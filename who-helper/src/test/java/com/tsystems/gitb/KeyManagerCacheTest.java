@@ -0,0 +1,51 @@
+package com.tsystems.gitb;
+
+import org.junit.jupiter.api.Test;
+
+import javax.net.ssl.KeyManager;
+import java.time.Duration;
+import java.util.concurrent.atomic.AtomicInteger;
+import java.util.concurrent.atomic.AtomicLong;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertSame;
+
+public class KeyManagerCacheTest {
+
+    @Test
+    public void reuseCachedEntry() throws Exception {
+        var cache = new KeyManagerCache(2, Duration.ofSeconds(60));
+        var loads = new AtomicInteger();
+        KeyManager[] first = cache.get("key", "crt", "EC", () -> { loads.incrementAndGet(); return new KeyManager[0]; });
+        KeyManager[] second = cache.get("key", "crt", "EC", () -> { loads.incrementAndGet(); return new KeyManager[0]; });
+        assertSame(first, second);
+        assertEquals(1, loads.get());
+    }
+
+    @Test
+    public void stayWithinSizeLimit() throws Exception {
+        var cache = new KeyManagerCache(2, Duration.ofSeconds(60));
+        var loads = new AtomicInteger();
+        for (int i = 0; i < 10; i++) {
+            cache.get("key" + i, "crt", "EC", () -> { loads.incrementAndGet(); return new KeyManager[0]; });
+        }
+        assertEquals(2, cache.size());
+        // The oldest entries were evicted and need to be loaded again.
+        cache.get("key0", "crt", "EC", () -> { loads.incrementAndGet(); return new KeyManager[0]; });
+        assertEquals(11, loads.get());
+        assertEquals(2, cache.size());
+    }
+
+    @Test
+    public void expireEntries() throws Exception {
+        var now = new AtomicLong();
+        var cache = new KeyManagerCache(2, Duration.ofSeconds(60), now::get);
+        var loads = new AtomicInteger();
+        cache.get("key", "crt", "EC", () -> { loads.incrementAndGet(); return new KeyManager[0]; });
+        now.addAndGet(Duration.ofSeconds(61).toMillis());
+        cache.get("key", "crt", "EC", () -> { loads.incrementAndGet(); return new KeyManager[0]; });
+        assertEquals(2, loads.get());
+        assertEquals(1, cache.size());
+    }
+
+}